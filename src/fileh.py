@@ -1,11 +1,13 @@
 """Handles file IO, save data and the playlist database of the app etc."""
 import datetime as dt
+import functools
 import json
 import os
 import pathlib
 import sqlite3
 from collections import namedtuple
-from typing import Callable, Iterable, Any
+from contextlib import suppress
+from typing import Callable, Iterable, Iterator, Any
 
 from utils import (
     APP_FOLDER, ALLOWED_EXTENSIONS, MAX_PLAYLIST_NAME_DISPLAY_LENGTH,
@@ -32,6 +34,10 @@ AUDIO_TABLE = "audio"
 PLAYLISTS_TABLE = "playlists"
 # Audio/playlists table. Removes m2m.
 AUDIO_PLAYLISTS_TABLE = "audio_playlists"
+# Sub-folders not worth scanning for audio (as well as hidden ones).
+SKIPPED_FOLDERS = frozenset((
+    "__pycache__", "node_modules", "$RECYCLE.BIN",
+    "System Volume Information"))
 
 # Playlist object.
 Playlist = namedtuple(
@@ -75,8 +81,37 @@ def create_folder(folder: pathlib.Path = DATA_FOLDER) -> None:
     return inner
 
 
+def walk_folder(
+    folder: pathlib.Path, is_recursive: bool
+) -> Iterator[os.DirEntry]:
+    """
+    Yields every entry in a folder, and in all sub-folders if recursive.
+    Sub-folders are scanned in order, depth first, skipping symlinked,
+    hidden, system and unreadable folders.
+    """
+    folders = [folder]
+    while folders:
+        subfolders = []
+        with suppress(OSError), os.scandir(folders.pop()) as entries:
+            for entry in entries:
+                yield entry
+                if (
+                    is_recursive and entry.is_dir(follow_symlinks=False)
+                    and not entry.name.startswith(".")
+                    and entry.name not in SKIPPED_FOLDERS
+                ):
+                    subfolders.append(entry.path)
+        # Reversed so the first sub-folder is scanned next.
+        folders.extend(reversed(subfolders))
+
+
+@functools.lru_cache(maxsize=1)
 def get_import_folder_settings() -> dict:
-    """Fetches previous import folder settings or default."""
+    """
+    Fetches previous import folder settings or default.
+    The file is only read again once the settings are updated,
+    so the returned settings must not be modified.
+    """
     try:
         with IMPORT_FOLDER_SETTINGS.open("r", encoding="utf8") as f:
             return json.load(f)
@@ -89,6 +124,7 @@ def update_import_folder_settings(settings: dict) -> None:
     """Updates import folder settings upon a new import."""
     with IMPORT_FOLDER_SETTINGS.open("w", encoding="utf8") as f:
         json.dump(settings, f)
+    get_import_folder_settings.cache_clear()
 
 
 @create_folder()
@@ -115,22 +151,23 @@ def set_up_database() -> None:
             CREATE TABLE IF NOT EXISTS
             {AUDIO_PLAYLISTS_TABLE}(audio_id, playlist_id, position)
             """)
+        # Allows the records of a playlist to be found using an index.
+        cursor.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS audio_playlists_playlist_id
+            ON {AUDIO_PLAYLISTS_TABLE}(playlist_id)
+            """)
 
 
 def insert_new_audio_files(cursor: sqlite3.Cursor, files: list[str]) -> None:
     """Inserts all new audio files to the audio table."""
-    insert_files = [
-        file for file in files if
-        # Query - Does not exist in the table.
-        not cursor.execute(
-            f"""
-            SELECT EXISTS
-            (SELECT * FROM {AUDIO_TABLE} WHERE file_path=?) 
-            """, (file,)).fetchone()[0]]
+    # Only inserts files which do not exist in the table.
     cursor.executemany(
         f"""
-        INSERT INTO {AUDIO_TABLE} (id, file_path) VALUES (NULL, ?)
-        """, ([file] for file in insert_files))
+        INSERT INTO {AUDIO_TABLE} (id, file_path)
+        SELECT NULL, ?1 WHERE NOT EXISTS
+        (SELECT * FROM {AUDIO_TABLE} WHERE file_path=?1)
+        """, ([file] for file in files))
 
 
 def insert_playlist_audio_records(
@@ -139,18 +176,14 @@ def insert_playlist_audio_records(
     """
     Inserts the playlist/audio records with playlist/audio ID and position.
     """
-    audio_playlist_records = []
-    for position, file in enumerate(files):
-        audio_id = cursor.execute(
-            f"SELECT id FROM {AUDIO_TABLE} WHERE file_path=?", (file,)
-        ).fetchone()[0]
-        record = (audio_id, playlist_id, position)
-        audio_playlist_records.append(record)
+    # Audio IDs are looked up by file path as part of the insert.
     cursor.executemany(
         f"""
-        INSERT INTO {AUDIO_PLAYLISTS_TABLE}
-        (audio_id, playlist_id, position) VALUES (?, ?, ?)
-        """, audio_playlist_records)
+        INSERT INTO {AUDIO_PLAYLISTS_TABLE} (audio_id, playlist_id, position)
+        SELECT id, ?, ? FROM {AUDIO_TABLE} WHERE file_path=?
+        """, (
+            (playlist_id, position, file)
+            for position, file in enumerate(files)))
 
 
 def delete_old_audio_ids(
@@ -162,16 +195,11 @@ def delete_old_audio_ids(
     This function should only be on audio IDs that have been cut
     off from a playlist after playlist update or deletion.
     """
-    to_delete = [
-        audio_id for audio_id in audio_ids
-        if not bool(cursor.execute(
-            f"""
-            SELECT EXISTS
-            (SELECT * FROM {AUDIO_PLAYLISTS_TABLE} WHERE audio_id=?)
-            """, (audio_id,)).fetchone()[0])]
     cursor.executemany(
-        f"DELETE FROM {AUDIO_TABLE} WHERE id=?",
-        ([audio_id] for audio_id in to_delete))
+        f"""
+        DELETE FROM {AUDIO_TABLE} WHERE id=?1 AND NOT EXISTS
+        (SELECT * FROM {AUDIO_PLAYLISTS_TABLE} WHERE audio_id=?1)
+        """, ([audio_id] for audio_id in audio_ids))
 
 
 def create_playlist(name: str, description: str, files: list[str]) -> None:
@@ -179,15 +207,14 @@ def create_playlist(name: str, description: str, files: list[str]) -> None:
     with Database() as cursor:
         insert_new_audio_files(cursor, files)
         date_time_created = dt.datetime.utcnow().isoformat()
+        # The new playlist ID is the row ID of the insert.
         playlist_id = cursor.execute(
             f"""
             INSERT INTO {PLAYLISTS_TABLE}
             (id, name, description, utc_date_time_created)
             VALUES (NULL, ?, ?, ?)
             """, (name, description, date_time_created)
-        ).execute(
-            f"SELECT id FROM {PLAYLISTS_TABLE} WHERE name=?", (name,)
-        ).fetchone()[0]
+        ).lastrowid
         insert_playlist_audio_records(cursor, playlist_id, files)
 
 
@@ -227,11 +254,18 @@ def update_playlist(
         delete_old_audio_ids(cursor, old_audio_ids - new_audio_ids)
 
 
-def delete_playlist(playlist_id: int) -> None:
-    """Deletes a given playlist by ID."""
+def delete_playlist(playlist_id: int) -> int:
+    """
+    Deletes a given playlist by ID.
+    Returns the number of playlists deleted (0 if already deleted).
+    """
     with Database() as cursor:
-        cursor.execute(
-            f"DELETE FROM {PLAYLISTS_TABLE} WHERE id=?", (playlist_id,))
+        deleted = cursor.execute(
+            f"DELETE FROM {PLAYLISTS_TABLE} WHERE id=?", (playlist_id,)
+        ).rowcount
+        if not deleted:
+            # Playlist no longer exists, nothing else to delete.
+            return 0
         # Get audio IDs of playlist to delete.
         audio_ids = get_audio_ids(cursor, playlist_id)
         cursor.execute(
@@ -240,6 +274,7 @@ def delete_playlist(playlist_id: int) -> None:
         # Deletes any audio records which no longer have any use
         # upon deleting the current playlist.
         delete_old_audio_ids(cursor, audio_ids)
+        return deleted
 
 
 def playlist_exists(value: Any, key: str = "name") -> bool:
@@ -252,6 +287,15 @@ def playlist_exists(value: Any, key: str = "name") -> bool:
             """, (value,)).fetchone()[0])
 
 
+def get_default_playlist_names() -> set[str]:
+    """Returns all existing playlist names starting with 'Playlist '."""
+    with Database() as cursor:
+        return set(
+            record[0] for record in cursor.execute(
+                f"SELECT name FROM {PLAYLISTS_TABLE} WHERE name LIKE ?",
+                ("Playlist %",)))
+
+
 def parse_date_time_created(utc_date_time: str) -> dt.datetime:
     """
     Converts a UTC time string to a local time datetime object
@@ -272,25 +316,21 @@ def load_playlists_overview() -> list[tuple]:
         playlist_records = cursor.execute(
             f"SELECT id, name, utc_date_time_created FROM {PLAYLISTS_TABLE}"
         ).fetchall()
-        audio_playlist_ids = cursor.execute(
-            f"SELECT playlist_id FROM {AUDIO_PLAYLISTS_TABLE}").fetchall()
-        # Calculates the length of each playlist by ID.
-        lengths = {}
-        for playlist_id in audio_playlist_ids:
-            # Using index 0 to access the value in the 1-tuple.
-            lengths[playlist_id[0]] = lengths.get(playlist_id[0], 0) + 1
-        playlists = []
-        # Generates the record for each playlist.
-        for record in playlist_records:
-            playlist_id = record[0]
-            name = limit_length(
-                record[1], MAX_PLAYLIST_NAME_DISPLAY_LENGTH)
-            length = lengths[playlist_id]
-            date_time_created = parse_date_time_created(record[2])
-            playlist_overview = (
-                playlist_id, name, length, date_time_created)
-            playlists.append(playlist_overview)
-        return playlists
+        # Counts the length of every playlist by ID in a single pass.
+        lengths = dict(cursor.execute(
+            f"""
+            SELECT playlist_id, COUNT(*) FROM {AUDIO_PLAYLISTS_TABLE}
+            GROUP BY playlist_id
+            """))
+    playlists = []
+    # Generates the record for each playlist.
+    for playlist_id, name, utc_date_time_created in playlist_records:
+        name = limit_length(name, MAX_PLAYLIST_NAME_DISPLAY_LENGTH)
+        length = lengths.get(playlist_id, 0)
+        date_time_created = parse_date_time_created(utc_date_time_created)
+        playlist_overview = (playlist_id, name, length, date_time_created)
+        playlists.append(playlist_overview)
+    return playlists
 
 
 def get_playlist(playlist_id: int) -> Playlist:
@@ -470,9 +470,9 @@ class PlaylistFrame(tk.Frame):
             self, font=inter(15, True), text=playlist.name, wraplength=300)
         self.listbox = PlaylistListbox(self)
         zfill = len(str(len(playlist)))
-        self.listbox.extend(
-            f"{str(i).zfill(zfill)} | {file}"
-            for i, file in enumerate(playlist.files, 1))
+        self.listbox.extend([
+            f"{i:0{zfill}d} | {file}"
+            for i, file in enumerate(playlist.files, 1)])
         self.update_select()
 
         self.seek_frame = PlaylistSeekFrame(self)
@@ -1,19 +1,26 @@
 """Handles playlist creation, playing, viewing, editing and deleting."""
+import bisect
 import enum
+import itertools
+import operator
+import os
 import pathlib
+import queue
 import random
+import threading
 import tkinter as tk
 from contextlib import suppress
 from tkinter import filedialog
 from tkinter import messagebox
-from typing import Callable
+from typing import Callable, Iterator, Sequence
 
 import main
 from colours import FG
 from fileh import (
     get_import_folder_settings, update_import_folder_settings,
     create_playlist, update_playlist, delete_playlist, playlist_exists,
-    load_playlists_overview, get_playlist, PlaylistNotFound
+    load_playlists_overview, get_playlist, get_default_playlist_names,
+    walk_folder, PlaylistNotFound
 )
 from utils import (
     inter, open_audio_file, bool_to_state, limit_length,
@@ -25,6 +32,12 @@ from widgets import (
 )
 
 
+# Fonts used throughout the playlist GUI, created once.
+FONT_12 = inter(12)
+FONT_15 = inter(15)
+FONT_20 = inter(20)
+FONT_25 = inter(25)
+FONT_30_BOLD = inter(30, True)
 # Sensible playlist metadata length limits.
 MAX_PLAYLIST_NAME_LENGTH = 100
 MAX_PLAYLIST_DESCRIPTION_LENGTH = 2000
@@ -34,6 +47,10 @@ MAX_PLAYLIST_LENGTH = 1000
 # Prevent performance issues - set a limit on the number of
 # paths (files or folders) to scan before displaying an error message.
 MAX_PATHS_TO_SCAN = 100_000
+# Number of paths to scan per batch passed back during a folder import.
+SCAN_BATCH_SIZE = 1000
+# Milliseconds between checks for scanned batches during a folder import.
+SCAN_POLL_INTERVAL = 50
 NOT_SET = "Not Set"
 # Table displayed upon viewing data.
 TABLE_COLUMNS = (
@@ -48,6 +65,10 @@ PLAYLIST_NAME_SIZE = {
     20: 25,
     0: 30
 }
+# Sorted name length thresholds and their corresponding font sizes.
+PLAYLIST_NAME_THRESHOLDS = tuple(sorted(PLAYLIST_NAME_SIZE))
+PLAYLIST_NAME_SIZES = tuple(
+    PLAYLIST_NAME_SIZE[length] for length in PLAYLIST_NAME_THRESHOLDS)
 # Description when empty.
 DEFAULT_DESCRIPTION = "No description provided."
 # Common error message whenever a playlist no longer exists.
@@ -58,6 +79,17 @@ MISSING_PLAYLIST_ERROR = {
 }
 # Maximum finite number of playlist repeats.
 MAX_PLAYLIST_LOOPS = 9
+# Milliseconds to wait for the playlist table selection to settle
+# before opening the selected playlist.
+OPEN_PLAYLIST_DELAY = 150
+# Number of playlists to load into the table at a time.
+PLAYLISTS_PAGE_SIZE = 100
+
+
+def get_playlist_name_size(name: str) -> int:
+    """Returns a suitable font size for a playlist name based on length."""
+    index = bisect.bisect_right(PLAYLIST_NAME_THRESHOLDS, len(name)) - 1
+    return PLAYLIST_NAME_SIZES[max(index, 0)]
 
 
 class SortBy(enum.Enum):
@@ -68,6 +100,15 @@ class SortBy(enum.Enum):
     date_time_created = "Created"
 
 
+# Sort key of the playlist records for each way of sorting the table.
+SORT_KEYS = {
+    SortBy.id: operator.itemgetter(0),
+    SortBy.name: lambda playlist: playlist[1].lower(),
+    SortBy.length: operator.itemgetter(2),
+    SortBy.date_time_created: operator.itemgetter(3)
+}
+
+
 class PlaylistPlayback:
     """
     Stores required playlist information during the playback,
@@ -115,6 +156,8 @@ class PlaylistForm(tk.Frame):
         self.from_view_playlists = from_view_playlists
         # 'create' or 'edit' used for string embedding.
         self.keyword = "create" if self.new else "edit"
+        # Name of the playlist being edited, None in create mode.
+        self.original_name = None
         if not self.new:
             try:
                 initial_data = get_playlist(self.playlist_id)
@@ -124,6 +167,7 @@ class PlaylistForm(tk.Frame):
                 self.change(confirm=False)
                 messagebox.showerror(**MISSING_PLAYLIST_ERROR)
                 return
+            self.original_name = initial_data.name
         # Return to view playlists if called from there, makes most sense.
         if self.new:
             master.root.title(f"{main.DEFAULT_TITLE} - Playlist - Create")
@@ -133,7 +177,7 @@ class PlaylistForm(tk.Frame):
                 f"{main.DEFAULT_TITLE} - Playlist - Edit ({playlist_id})")
 
         self.title = tk.Label(
-            self, font=inter(30, True),
+            self, font=FONT_30_BOLD,
             text=f"{self.keyword.title()} Playlist")
         if self.new:
             # Create blank inputs to start with.
@@ -168,8 +212,8 @@ class PlaylistForm(tk.Frame):
             messagebox.showerror("Empty Name", "Please enter a playlist name.")
             return
         description = self.metadata_frame.description
-        # pathlib.Path -> str. Ready to be inserted into DB if needed.
-        files = [str(file) for file in self.audio_frame.files]
+        # Already strings, only read by the DB functions.
+        files = self.audio_frame.files
         # Only makes sense for a playlist to have at least 2 files.
         if len(files) < MIN_PLAYLIST_LENGTH:
             messagebox.showerror(
@@ -182,7 +226,7 @@ class PlaylistForm(tk.Frame):
             messagebox.showerror(**MISSING_PLAYLIST_ERROR)
             return
         if playlist_exists(name) and (
-            self.new or get_playlist(self.playlist_id).name != name
+            self.new or self.original_name != name
         ):
             messagebox.showerror(
                 "Existing Playlist",
@@ -223,7 +267,7 @@ class PlaylistForm(tk.Frame):
                 f"{self.keyword} this playlist? All unsaved data will be lost."
         ):
             return
-        for binding in ("Control-o", "control-i"):
+        for binding in ("Control-o", "Control-i"):
             self.master.root.unbind(f"<{binding}>")
         if command is None:
             # By default, return to the main audio player.
@@ -243,21 +287,21 @@ class PlaylistFormMenu(tk.Menu):
         self.file_menu = tk.Menu(self, tearoff=False)
         self.file_menu.add_command(
             label="Add File (Ctrl+O)",
-            font=inter(12), command=master.audio_frame.add_file)
+            font=FONT_12, command=master.audio_frame.add_file)
         self.file_menu.add_command(
-            label="Import Folder (Ctrl+I)", font=inter(12),
+            label="Import Folder (Ctrl+I)", font=FONT_12,
             command=master.audio_frame.import_folder)
         self.file_menu.add_separator()
         self.file_menu.add_command(
-            label="Back", font=inter(12), command=master.change)
+            label="Back", font=FONT_12, command=master.change)
         self.file_menu.add_command(
-            label="Close App (Alt+F4)", font=inter(12),
+            label="Close App (Alt+F4)", font=FONT_12,
             command=lambda: main.quit_app(master.master.root))
         self.add_cascade(label="File", menu=self.file_menu)
 
         self.playlists_menu = tk.Menu(self, tearoff=False)
         self.playlists_menu.add_command(
-            label="View", font=inter(12),
+            label="View", font=FONT_12,
             command=lambda: master.change(master.master.view_playlists))
         self.add_cascade(label="Playlists", menu=self.playlists_menu)
 
@@ -270,11 +314,12 @@ class PlaylistFormMetadataFrame(tk.Frame):
     ) -> None:
         super().__init__(master)
         self.name_label = tk.Label(
-            self, font=inter(15), text="Name of playlist:")
+            self, font=FONT_15, text="Name of playlist:")
         if not name:
             n = 1
+            existing_names = get_default_playlist_names()
             # Finds the first Playlist {n} name not in use.
-            while playlist_exists(f"Playlist {n}"):
+            while f"Playlist {n}" in existing_names:
                 n += 1
             name = f"Playlist {n}"
         self.name_entry = StringEntry(
@@ -282,7 +327,7 @@ class PlaylistFormMetadataFrame(tk.Frame):
             initial_value=name)
         
         self.description_label = tk.Label(
-            self, font=inter(15), text="Description (optional):")
+            self, font=FONT_15, text="Description (optional):")
         self.description_entry = Textbox(
             self, height=5, max_length=MAX_PLAYLIST_DESCRIPTION_LENGTH)
         self.description_entry.textbox.insert("1.0", description)
@@ -314,9 +359,12 @@ class PlaylistFormAudioFrame(tk.Frame):
         self.import_folder_button = Button(
             self, "Import Folder", command=self.import_folder)
         self.file_handling_frame = FileHandlingFrame(self)
-        self.files = list(map(pathlib.Path, files or []))
+        # Normalised file path strings.
+        self.files = list(map(os.path.normpath, files or []))
+        # Case-normalised files as a set, for fast duplicate checks.
+        self.file_set = set(map(os.path.normcase, self.files))
         self.file_count_label = tk.Label(
-            self, font=inter(20), text=f"Files: {len(self.files)}")
+            self, font=FONT_20, text=f"Files: {len(self.files)}")
         self.listbox.extend(self.files)
         self.opened_import_window = False
     
@@ -357,11 +405,13 @@ class PlaylistFormAudioFrame(tk.Frame):
         file_path = open_audio_file()
         if file_path is None:
             return
-        file_path = pathlib.Path(file_path)
-        if file_path in self.files:
+        file_path = os.path.normpath(file_path)
+        key = os.path.normcase(file_path)
+        if key in self.file_set:
             messagebox.showinfo("Note", "File already added.")
             return
         self.files.append(file_path)
+        self.file_set.add(key)
         self.listbox.append(file_path)
         self.update_file_count_label()
     
@@ -389,23 +439,33 @@ class ImportFolderToplevel(tk.Toplevel):
         self.resizable(False, False)
         self.protocol("WM_DELETE_WINDOW", self.close)
         self.title_label = tk.Label(
-            self, font=inter(30, True), text="Import Folder")
-        self.folder_label = tk.Label(self, font=inter(15), text="Folder:")
+            self, font=FONT_30_BOLD, text="Import Folder")
+        self.folder_label = tk.Label(self, font=FONT_15, text="Folder:")
         # Approximate Windows file length limit is 260 characters.
         self.folder_entry = StringEntry(
             self, max_length=260, state="disabled", disabledforeground=FG,
             initial_value=NOT_SET)
+        # Whether a folder has been selected yet.
+        self.folder_selected = False
         self.select_folder_button = Button(
-            self, "Select", inter(12), command=self.select_folder)
+            self, "Select", FONT_12, command=self.select_folder)
         self.bind("<Control-o>", lambda *_: self.select_folder())
 
         settings = get_import_folder_settings()
+        # Folder scan state, the scan runs in a separate thread.
+        self.scanning = False
+        self.scan_id = None
+        self.scan_cancelled = None
+        # Files found so far during a scan.
+        self.existing_files = set()
+        self.new_files = []
+        self.already_added_count = 0
         
         self.file_types_label = tk.Label(
-            self, font=inter(15), text="File types to include:")
+            self, font=FONT_15, text="File types to include:")
         self.file_types_input = FileTypesFrame(self, settings["extensions"])
 
-        self.scope_label = tk.Label(self, font=inter(15), text="Search Scope:")
+        self.scope_label = tk.Label(self, font=FONT_15, text="Search Scope:")
         self.scope_frame = SearchScopeFrame(self, settings["recursive"])
 
         self.import_button = Button(
@@ -433,44 +493,134 @@ class ImportFolderToplevel(tk.Toplevel):
             # Cancelled
             return
         self.folder_entry.variable.set(folder)
+        self.folder_selected = True
         self.update_button_state()
     
     def import_folder(self) -> None:
-        """Validates input and subsequently performs folder input."""
+        """Starts scanning the folder for audio files to import."""
         folder = pathlib.Path(self.folder_entry.value)
         extensions = self.file_types_input.selected
         is_recursive = self.scope_frame.recursive
+        # Drive roots (and other mount points) are rarely worth a full scan.
+        if is_recursive and os.path.ismount(folder) and not (
+            messagebox.askyesnocancel(
+                "Drive Scan",
+                    "Recursively scanning an entire drive can be slow and "
+                    "may reach the maximum number of paths to scan. "
+                    "Are you sure you would like to continue?", parent=self)
+        ):
+            return
+        batches = self.get_files(
+            folder, frozenset(extension.lower() for extension in extensions),
+            is_recursive)
+        self.existing_files = self.master.file_set
+        self.new_files = []
+        self.already_added_count = 0
+        self.scanning = True
+        # The import button cancels the scan until it is over.
+        self.import_button.config(text="Cancel Scan", command=self.cancel_scan)
+        scan_queue = queue.Queue()
+        self.scan_cancelled = threading.Event()
+        threading.Thread(
+            target=self.scan_worker,
+            args=(batches, scan_queue, self.scan_cancelled),
+            daemon=True).start()
+        self.poll_scan(scan_queue, extensions, is_recursive)
+    
+    @staticmethod
+    def scan_worker(
+        batches: Iterator[list[str]], scan_queue: queue.Queue,
+        cancelled: threading.Event
+    ) -> None:
+        """
+        Runs the folder scan away from the GUI thread, passing each batch
+        of files to the queue, then None when done, or the error raised.
+        No Tk calls may be made here.
+        """
         try:
-            files = self.get_files(folder, set(extensions), is_recursive)
-            if not files:
-                messagebox.showerror(
-                    "Nothing",
-                        "No audio files found with the given criteria.",
-                        parent=self)
-                return
-        except RuntimeError:
+            for batch in batches:
+                if cancelled.is_set():
+                    return
+                scan_queue.put(batch)
+        except Exception as e:
+            scan_queue.put(e)
+            return
+        scan_queue.put(None)
+    
+    def poll_scan(
+        self, scan_queue: queue.Queue, extensions: list[str],
+        is_recursive: bool
+    ) -> None:
+        """
+        Handles the files scanned so far,
+        rescheduling itself until the scan is done.
+        """
+        with suppress(queue.Empty):
+            while True:
+                batch = scan_queue.get_nowait()
+                if batch is None:
+                    self.stop_scan()
+                    self.add_files(extensions, is_recursive)
+                    return
+                if isinstance(batch, Exception):
+                    self.stop_scan()
+                    if not isinstance(batch, RuntimeError):
+                        raise batch
+                    messagebox.showerror(
+                        "Error",
+                            f"Maximum paths scanned: {MAX_PATHS_TO_SCAN}. "
+                            "Please reduce the search scope.", parent=self)
+                    return
+                new = [
+                    file for file in batch
+                    if os.path.normcase(file) not in self.existing_files]
+                self.already_added_count += len(batch) - len(new)
+                self.new_files.extend(new)
+                new_file_count = len(self.existing_files) + len(self.new_files)
+                if new_file_count > MAX_PLAYLIST_LENGTH:
+                    # No need to scan any further, the import is not allowed.
+                    self.scan_cancelled.set()
+                    self.stop_scan()
+                    messagebox.showerror(
+                        "Error",
+                            "This import will bring the number of files above "
+                            "the maximum allowed number of files: "
+                            f"{MAX_PLAYLIST_LENGTH}", parent=self)
+                    return
+        self.scan_id = self.after(
+            SCAN_POLL_INTERVAL,
+            lambda: self.poll_scan(scan_queue, extensions, is_recursive))
+    
+    def stop_scan(self) -> None:
+        """Resets the scanning state once the scan is over."""
+        self.scanning = False
+        self.scan_id = None
+        self.import_button.config(text="Import", command=self.import_folder)
+        self.update_button_state()
+
+    def cancel_scan(self) -> None:
+        """Stops the scan in progress, discarding any files found."""
+        if self.scan_id is not None:
+            self.after_cancel(self.scan_id)
+        self.scan_cancelled.set()
+        self.stop_scan()
+    
+    def add_files(self, extensions: list[str], is_recursive: bool) -> None:
+        """Validates the scanned files and subsequently adds them."""
+        new = self.new_files
+        already_added_count = self.already_added_count
+        if not (new or already_added_count):
             messagebox.showerror(
-                "Error",
-                    f"Maximum paths scanned: {MAX_PATHS_TO_SCAN}. "
-                    "Please reduce the search scope.", parent=self)
+                "Nothing",
+                    "No audio files found with the given criteria.",
+                    parent=self)
             return
-        existing_files = set(self.master.files)
-        new = [file for file in files if file not in existing_files]
         if not new:
             messagebox.showerror(
                 "Nothing",
                     "No new audio files found with the given criteria.",
                     parent=self)
             return
-        new_file_count = len(existing_files) + len(new)
-        if new_file_count > MAX_PLAYLIST_LENGTH:
-            messagebox.showerror(
-                "Error",
-                    "This import will bring the number of files to "
-                    f"{new_file_count}, which exceeds the maximum allowed "
-                    f"number of files: {MAX_PLAYLIST_LENGTH}", parent=self)
-            return
-        already_added_count = len(files) - len(new)
         if already_added_count and not messagebox.askyesnocancel(
             "Duplicates",
                 f"{already_added_count} file"
@@ -480,6 +630,7 @@ class ImportFolderToplevel(tk.Toplevel):
         ):
             return
         self.master.files.extend(new)
+        self.master.file_set.update(map(os.path.normcase, new))
         self.master.listbox.extend(new)
         self.master.update_file_count_label()
         settings = {"extensions": extensions, "recursive": is_recursive}
@@ -487,33 +638,49 @@ class ImportFolderToplevel(tk.Toplevel):
         self.close()
     
     def get_files(
-        self, folder: pathlib.Path, extensions: set[str], is_recursive: bool
-    ) -> list[pathlib.Path]:
+        self, folder: pathlib.Path, extensions: frozenset[str],
+        is_recursive: bool
+    ) -> Iterator[list[str]]:
         """
-        Returns a list of all audio files with the given extensions
-        in the path, not case-sensitve.
+        Yields all audio files with the given extensions in the path,
+        not case-sensitve, in batches per SCAN_BATCH_SIZE paths scanned.
+        Extensions must be lowercase.
         """
-        generator = folder.iterdir() if not is_recursive else folder.rglob("*")
-        files = []
-        count = 0
-        for path in generator:
-            count += 1
-            if count > MAX_PATHS_TO_SCAN:
+        entries = walk_folder(folder, is_recursive)
+        scanned = 0
+        while batch := list(itertools.islice(entries, SCAN_BATCH_SIZE)):
+            scanned += len(batch)
+            if scanned > MAX_PATHS_TO_SCAN:
                 raise RuntimeError
-            if path.is_file() and path.suffix.lower() in extensions:
-                files.append(path)
-        return files
+            files = []
+            for entry in batch:
+                name = entry.name
+                # As with Path.suffix, a leading dot is not a suffix.
+                # Checked first as it needs no file system access.
+                dot = name.rfind(".")
+                if (
+                    dot > 0 and name[dot:].lower() in extensions
+                    # Directory entries are used to avoid extra stats.
+                    and entry.is_file()
+                ):
+                    # Already normalised, given the folder is a Path.
+                    files.append(entry.path)
+            yield files
 
     def update_button_state(self) -> None:
         """Changes the state of the import button based on basic validation."""
+        if self.scanning:
+            # The button cancels the scan instead, which is always allowed.
+            return
         # Folder selected and at least one audio type selected.
         valid = (
-            self.folder_entry.value != NOT_SET
-            and self.file_types_input.selected)
+            self.folder_selected and self.file_types_input.selected_set)
         self.import_button.config(state=bool_to_state(valid))
     
     def close(self) -> None:
-        """Closes the window."""
+        """Closes the window, cancelling any scan in progress."""
+        if self.scanning:
+            self.cancel_scan()
         self.destroy()
         self.master.opened_import_window = False
 
@@ -525,11 +692,11 @@ class ImportFolderToplevelMenu(tk.Menu):
         super().__init__(master)
         self.file_menu = tk.Menu(self, tearoff=False)
         self.file_menu.add_command(
-            label="Select (Ctrl+O)", font=inter(12),
+            label="Select (Ctrl+O)", font=FONT_12,
             command=master.select_folder)
         self.file_menu.add_separator()
         self.file_menu.add_command(
-            label="Cancel (Alt+F4)", font=inter(12), command=master.close)
+            label="Cancel (Alt+F4)", font=FONT_12, command=master.close)
         self.add_cascade(label="File", menu=self.file_menu)
 
 
@@ -540,23 +707,35 @@ class FileTypesFrame(tk.Frame):
         self, master: ImportFolderToplevel, initial_extensions: list[str]
     ) -> None:
         super().__init__(master)
+        # Kept in sync with the states, avoiding reading every variable.
+        self.selected_set = set(ALLOWED_EXTENSIONS).intersection(
+            initial_extensions)
         # Stores enabled/disabled for each file extension.
         self.states = {
-            extension: tk.BooleanVar(value=extension in initial_extensions)
+            extension: tk.BooleanVar(value=extension in self.selected_set)
             for extension in ALLOWED_EXTENSIONS
         }
         for i, (extension, variable) in enumerate(self.states.items()):
             checkbutton = Checkbutton(
-                self, extension, variable, command=master.update_button_state)
+                self, extension, variable,
+                command=lambda extension=extension: self.toggle(extension))
             checkbutton.grid(
                 row=i//2, column=i%2, padx=5, pady=5, sticky="w")
 
+    def toggle(self, extension: str) -> None:
+        """Records a change in the selection of a given extension."""
+        if self.states[extension].get():
+            self.selected_set.add(extension)
+        else:
+            self.selected_set.discard(extension)
+        self.master.update_button_state()
+
     @property
     def selected(self) -> list[str]:
         """Returns the selected extensions."""
         return [
-            extension
-            for extension, state in self.states.items() if state.get()]
+            extension for extension in ALLOWED_EXTENSIONS
+            if extension in self.selected_set]
 
 
 class SearchScopeFrame(tk.Frame):
@@ -590,11 +769,11 @@ class FileHandlingFrame(tk.Frame):
     def __init__(self, master: PlaylistFormAudioFrame) -> None:
         super().__init__(master)
         self.delete_button = Button(
-            self, "Delete", inter(12), command=self.delete)
+            self, "Delete", FONT_12, command=self.delete)
         self.move_up_button = Button(
-            self, "Move Up", inter(12), command=lambda: self.swap(-1))
+            self, "Move Up", FONT_12, command=lambda: self.swap(-1))
         self.move_down_button = Button(
-            self, "Move Down", inter(12), command=lambda: self.swap(+1))
+            self, "Move Down", FONT_12, command=lambda: self.swap(+1))
         self.update_state()
 
         self.delete_button.pack(padx=10, pady=5)
@@ -604,12 +783,13 @@ class FileHandlingFrame(tk.Frame):
     def delete(self) -> None:
         """Removes the currently selected file from the playlist."""
         index = self.master.listbox.current_index
-        self.master.files.pop(index)
+        self.master.file_set.remove(
+            os.path.normcase(self.master.files.pop(index)))
         self.master.listbox.pop(index)
-        if index < self.master.listbox.size:
+        if index < len(self.master.files):
             self.master.listbox.listbox.selection_set(index)
         self.master.update_file_count_label()
-        self.update_state()
+        self.update_state(index)
     
     def swap(self, index_difference: int) -> None:
         """For swapping two values - used in move up and move down."""
@@ -618,12 +798,16 @@ class FileHandlingFrame(tk.Frame):
         files[index], files[index + index_difference] = (
             files[index + index_difference], files[index])
         self.master.listbox.swap(index, index + index_difference)
-        self.update_state()
+        self.update_state(index + index_difference)
 
-    def update_state(self) -> None:
-        """Updates button states based on currently selected index."""
-        index = self.master.listbox.current_index
+    def update_state(self, index: int | None = None) -> None:
+        """
+        Updates button states based on currently selected index,
+        which is looked up if not already known.
+        """
         if index is None:
+            index = self.master.listbox.current_index
+        if index is None or index >= len(self.master.files):
             # Nothing selected.
             self.delete_button.config(state="disabled")
             self.move_up_button.config(state="disabled")
@@ -634,8 +818,9 @@ class FileHandlingFrame(tk.Frame):
         # Can move up if index > 0 i.e. index != 0.
         self.move_up_button.config(state=bool_to_state(index))
         # Can move down if element is not the last.
-        size = self.master.listbox.size
-        self.move_down_button.config(state=bool_to_state(index < size - 1))
+        # The files list mirrors the listbox, so its length is the size.
+        self.move_down_button.config(
+            state=bool_to_state(index < len(self.master.files) - 1))
 
 
 class PlaylistFormButtons(tk.Frame):
@@ -644,9 +829,9 @@ class PlaylistFormButtons(tk.Frame):
     def __init__(self, master: PlaylistForm) -> None:
         super().__init__(master)
         self.cancel_button = Button(
-            self, "Back", inter(20), command=master.change)
+            self, "Back", FONT_20, command=master.change)
         self.upsert_button = Button(
-            self, master.keyword.title(), inter(20), command=master.upsert)
+            self, master.keyword.title(), FONT_20, command=master.upsert)
         
         self.cancel_button.pack(side="left", padx=5)
         self.upsert_button.pack(side="right", padx=5)
@@ -670,11 +855,17 @@ class ViewPlaylists(tk.Frame):
         master.root.title(f"{main.DEFAULT_TITLE} - Playlists")
         self.playlist_records = load_playlists_overview()
 
-        self.title = tk.Label(self, font=inter(30, True), text="Playlists")
+        self.title = tk.Label(self, font=FONT_30_BOLD, text="Playlists")
+        # Pending calls to add the next page of playlists to the table
+        # and to open the selected playlist, if any.
+        self.load_page_id = None
+        self.open_playlist_id = None
 
         if self.playlist_records:
             self.sort_by = None
             self.ascending = True
+            # Number of sorted playlists added to the table so far.
+            self.loaded_count = 0
             self.table = PlaylistsTable(self)
             self.sort(SortBy.name, initial=True)
 
@@ -688,7 +879,7 @@ class ViewPlaylists(tk.Frame):
         else:
             # No playlists.
             self.no_playlists_label = tk.Label(
-                self, font=inter(25),
+                self, font=FONT_25,
                 text="No playlists found.\nCreate a playlist to get started!")
         self.navigation_frame = ViewPlaylistsButtons(self)
 
@@ -722,14 +913,13 @@ class ViewPlaylists(tk.Frame):
         The initial flag indicates if the method is called from __init__.
         The update flag indicates if the method is called by the program
         at a later point such as after deleting a playlist.
+        The sorted records are added to the table in pages.
         """
+        if self.load_page_id is not None:
+            # Stop loading pages in the previous order.
+            self.after_cancel(self.load_page_id)
+            self.load_page_id = None
         self.table.clear()
-        sort_functions = {
-            SortBy.id: lambda playlist: playlist[0],
-            SortBy.name: lambda playlist: playlist[1].lower(),
-            SortBy.length: lambda playlist: playlist[2],
-            SortBy.date_time_created: lambda playlist: playlist[3]
-        }
         if sort_by == self.sort_by:
             if not update:
                 # Same filter reversed, only if not from the program.
@@ -740,29 +930,63 @@ class ViewPlaylists(tk.Frame):
         if initial:
             # Sorts the playlist records in place.
             self.playlist_records.sort(
-                key=sort_functions[sort_by], reverse=not self.ascending)
+                key=SORT_KEYS[sort_by], reverse=not self.ascending)
         else:
             # Also updates the playlist records in the process.
             self.playlist_records = sorted(
-                load_playlists_overview(), key=sort_functions[sort_by],
+                load_playlists_overview(), key=SORT_KEYS[sort_by],
                 reverse=not self.ascending)
             if not self.playlist_records:
                 # Refresh and display the no playlists screen.
                 self.master.view_playlists()
                 return
-        self.table.extend(self.playlist_records)
         self.sort_by = sort_by
+        # The first page is shown now and the rest once idle.
+        self.loaded_count = 0
+        self.load_next_page()
         # Only need to update the sort by display if already existent.
         if not initial:
             self.info_frame.update_total_playlists()
             self.info_frame.update_sort_by()
     
+    def load_next_page(self) -> None:
+        """Adds the next page of the sorted playlists to the table."""
+        page = self.playlist_records[
+            self.loaded_count:self.loaded_count + PLAYLISTS_PAGE_SIZE]
+        self.table.extend(page)
+        self.loaded_count += len(page)
+        if self.loaded_count < len(self.playlist_records):
+            self.load_page_id = self.after_idle(self.load_next_page)
+        else:
+            self.load_page_id = None
+    
     def home(self) -> None:
         """Returns back to the main app."""
         self.master.update_state()
+
+    def destroy(self) -> None:
+        """Cancels any pending calls before destroying the frame."""
+        if self.load_page_id is not None:
+            self.after_cancel(self.load_page_id)
+            self.load_page_id = None
+        if self.open_playlist_id is not None:
+            self.after_cancel(self.open_playlist_id)
+            self.open_playlist_id = None
+        super().destroy()
+    
+    def select_playlist(self) -> None:
+        """
+        Opens the selected playlist once the selection settles, so a burst
+        of selection changes only loads the last selected playlist.
+        """
+        if self.open_playlist_id is not None:
+            self.after_cancel(self.open_playlist_id)
+        self.open_playlist_id = self.after(
+            OPEN_PLAYLIST_DELAY, self.open_playlist)
     
     def open_playlist(self) -> None:
         """Opens the toplevel for a given playlist."""
+        self.open_playlist_id = None
         if self.playlist_open:
             # Toplevel already open, do not allow another.
             return
@@ -779,14 +1003,14 @@ class ViewPlaylistsMenu(tk.Menu):
         super().__init__(master)
         self.file_menu = tk.Menu(self, tearoff=False)
         self.file_menu.add_command(
-            label="Home", font=inter(12), command=master.home)
+            label="Home", font=FONT_12, command=master.home)
         self.file_menu.add_command(
-            label="Close App (Alt+F4)", font=inter(12), command=main.quit_app)
+            label="Close App (Alt+F4)", font=FONT_12, command=main.quit_app)
         self.add_cascade(label="File", menu=self.file_menu)
 
         self.playlists_menu = tk.Menu(self, tearoff=False)
         self.playlists_menu.add_command(
-            label="Create", font=inter(12),
+            label="Create", font=FONT_12,
             command=master.master.create_playlist)
         self.add_cascade(label="Playlists", menu=self.playlists_menu)
 
@@ -801,7 +1025,7 @@ class PlaylistsTable(Table):
     def __init__(self, master: ViewPlaylists) -> None:
         super().__init__(master, TABLE_COLUMNS)
         self.treeview.bind(
-            "<<TreeviewSelect>>", lambda *_: master.open_playlist())
+            "<<TreeviewSelect>>", lambda *_: master.select_playlist())
 
 
 class ViewPlaylistsInfo(tk.Frame):
@@ -810,9 +1034,9 @@ class ViewPlaylistsInfo(tk.Frame):
     def __init__(self, master: ViewPlaylists) -> None:
         super().__init__(master)
         self.count_label = tk.Label(
-            self, font=inter(15), width=30,
+            self, font=FONT_15, width=30,
             text=f"Total Playlists: {len(master.playlist_records)}")
-        self.sort_by_label = tk.Label(self, font=inter(15), width=30)
+        self.sort_by_label = tk.Label(self, font=FONT_15, width=30)
         self.update_sort_by()
         self.count_label.pack(padx=10, side="left")
         self.sort_by_label.pack(padx=10, side="right")
@@ -861,12 +1085,10 @@ class PlaylistToplevel(tk.Toplevel):
         self.grab_set()
         self.protocol("WM_DELETE_WINDOW", self.close)
         # Sets an appropriate playlist name size based on name length.
-        for length, size in PLAYLIST_NAME_SIZE.items():
-            if len(self.data.name) >= length:
-                break 
+        size = get_playlist_name_size(self.data.name)
         self.name_label = tk.Label(
             self, font=inter(size, True), text=self.data.name, wraplength=1000)
-        self.metadata_label = tk.Label(self, font=inter(15))
+        self.metadata_label = tk.Label(self, font=FONT_15)
         self.update_metadata_text()
         self.description_text = Textbox(self, width=100, height=5)
         self.description_text.text = (
@@ -910,12 +1132,11 @@ class PlaylistToplevel(tk.Toplevel):
         ):
             return
         try:
-            if not playlist_exists(self.data.id, "id"):
+            if not delete_playlist(self.data.id):
                 messagebox.showinfo(
                     "Playlist Already Deleted",
                         "The playlist has already been deleted.", parent=self)
             else:
-                delete_playlist(self.data.id)
                 messagebox.showinfo(
                     "Success",
                         "Successfully deleted the playlist.", parent=self)
@@ -938,6 +1159,8 @@ class PlaylistToplevel(tk.Toplevel):
                 "files from the playlist?", parent=self
         ):
             return
+        # Files currently shown in the listbox, possibly outdated.
+        displayed_files = self.data.files
         # Retrieves an up-to-date version of the data in case
         # of changes from another process.
         try:
@@ -946,11 +1169,16 @@ class PlaylistToplevel(tk.Toplevel):
             self.close()
             self.master.sort(self.master.sort_by, update=True)
             messagebox.showerror(**MISSING_PLAYLIST_ERROR, parent=self)
-        old_length = len(self.data.files)
+        old_files = self.data.files
+        old_length = len(old_files)
         # Determines new files.
-        files = [
-            file for file in self.data.files if pathlib.Path(file).is_file()]
+        files = [file for file in old_files if pathlib.Path(file).is_file()]
         new_length = len(files)
+        # Rows before the first removed file are unaffected by the clean.
+        first_removed = next(
+            (i for i, (old_file, new_file) in enumerate(
+                zip(old_files, files)) if old_file != new_file),
+            new_length)
         if new_length == old_length:
             # No length change, no action needed.
             messagebox.showinfo(
@@ -979,7 +1207,15 @@ class PlaylistToplevel(tk.Toplevel):
                 "The playlist was successfully cleaned and reduced from "
                 f"{old_length} to {new_length} files.", parent=self)
         self.update_metadata_text()
-        self.update_files_listbox()
+        if (
+            displayed_files == old_files
+            and len(str(new_length)) == len(str(old_length))
+        ):
+            # Listbox was up to date and padding unchanged,
+            # so only refresh rows from the first removal.
+            self.update_files_listbox(first_removed)
+        else:
+            self.update_files_listbox()
 
     def update_metadata_text(self) -> None:
         """Updates the metadata information label."""
@@ -989,15 +1225,18 @@ class PlaylistToplevel(tk.Toplevel):
             f"Length: {len(self.data.files)}")
         self.metadata_label.config(text=metadata_text)
     
-    def update_files_listbox(self) -> None:
-        """Updates the listbox of playlist files."""
-        self.files_listbox.clear()
+    def update_files_listbox(self, start: int = 0) -> None:
+        """
+        Updates the listbox of playlist files.
+        Rows before the start index are assumed to be unchanged.
+        """
+        self.files_listbox.clear(start)
         # Pad all file numbers to the number of digits of the
         # maximum file number.
         zfill = len(str(len(self.data.files)))
-        self.files_listbox.extend(
-            f"{str(i).zfill(zfill)} | {file}"
-            for i, file in enumerate(self.data.files, 1))
+        self.files_listbox.extend([
+            f"{i:0{zfill}d} | {file}"
+            for i, file in enumerate(self.data.files[start:], start + 1)])
     
     def close(self) -> None:
         """Closes this playlist's toplevel."""
@@ -1013,12 +1252,12 @@ class PlaylistButtons(tk.Frame):
 
     def __init__(self, master: PlaylistToplevel) -> None:
         super().__init__(master)
-        self.play_button = Button(self, "Play", inter(25), command=master.play)
-        self.edit_button = Button(self, "Edit", inter(12), command=master.edit)
+        self.play_button = Button(self, "Play", FONT_25, command=master.play)
+        self.edit_button = Button(self, "Edit", FONT_12, command=master.edit)
         self.clean_button = Button(
-            self, "Clean", inter(12), command=master.clean)
+            self, "Clean", FONT_12, command=master.clean)
         self.delete_button = Button(
-            self, "Delete", inter(12), command=master.delete)
+            self, "Delete", FONT_12, command=master.delete)
 
         self.play_button.grid(
             row=0, column=0, rowspan=3, padx=(200, 100), pady=5, sticky="w")
@@ -1042,20 +1281,22 @@ class PlaylistPlayFrame(tk.Frame):
             messagebox.showerror(**MISSING_PLAYLIST_ERROR)
             return
         super().__init__(master)
-        self.original_order = self.data.files.copy()
+        # The original order is fixed, so its listbox lines are only
+        # generated once and reused upon resetting the order.
+        self.original_order = tuple(self.data.files)
+        self.original_lines = self.get_listbox_lines(self.original_order)
+        self.order_changed = False
         master.root.title(
             f"{main.DEFAULT_TITLE} - Playlist - {self.data.name} - Play")
-        for length, size in PLAYLIST_NAME_SIZE.items():
-            if len(self.data.name) >= length:
-                break
+        size = get_playlist_name_size(self.data.name)
         self.title = tk.Label(
             self, font=inter(size, True), text=self.data.name, wraplength=1000)
         self.length_label = tk.Label(
-            self, font=inter(15), text=f"Files: {len(self.data.files)}")
+            self, font=FONT_15, text=f"Files: {len(self.data.files)}")
         self.separator1 = HorizontalLine(self, 750)
         self.listbox = Listbox(
             self, width=100, height=12, horizontal_scrollbar=True)
-        self.fill_listbox(self.data.files)
+        self.fill_listbox(self.original_lines)
         self.settings_frame = PlaylistPlaySettingsFrame(self)
         self.separator2 = HorizontalLine(self, 750)
         self.buttons = PlaylistPlayButtons(self)
@@ -1073,13 +1314,18 @@ class PlaylistPlayFrame(tk.Frame):
         self.buttons.pack(padx=5, pady=2)
         master.root.config(menu=self.menu)
     
-    def fill_listbox(self, files: list[str]) -> None:
-        """Fills the listbox with the given files."""
-        self.listbox.clear()
+    @staticmethod
+    def get_listbox_lines(files: Sequence[str]) -> list[str]:
+        """Returns the numbered listbox lines for the given files."""
         zfill = len(str(len(files)))
-        self.listbox.extend(
-            f"{str(i).zfill(zfill)} | {file}"
-            for i, file in enumerate(files, 1))
+        return [
+            f"{i:0{zfill}d} | {file}"
+            for i, file in enumerate(files, 1)]
+
+    def fill_listbox(self, lines: list[str]) -> None:
+        """Fills the listbox with the given lines."""
+        self.listbox.clear()
+        self.listbox.extend(lines)
     
     def reset_order(self) -> None:
         """Resets the order of the files back to the original."""
@@ -1087,14 +1333,17 @@ class PlaylistPlayFrame(tk.Frame):
             # Button disabled, also cannot access through keybind.
             return
         self.data.files[:] = self.original_order
-        self.fill_listbox(self.data.files)
+        self.order_changed = False
+        self.fill_listbox(self.original_lines)
         self.settings_frame.update_reset_order_state()
         self.menu.update_state()
     
     def shuffle(self) -> None:
         """Shuffles the order of the files."""
         random.shuffle(self.data.files)
-        self.fill_listbox(self.data.files)
+        # A shuffle may happen to leave the original order intact.
+        self.order_changed = tuple(self.data.files) != self.original_order
+        self.fill_listbox(self.get_listbox_lines(self.data.files))
         self.settings_frame.update_reset_order_state()
         self.menu.update_state()
     
@@ -1128,17 +1377,17 @@ class PlaylistPlayMenu(tk.Menu):
         super().__init__(master)
         self.file_menu = tk.Menu(self, tearoff=False)
         self.file_menu.add_command(
-            label="Reset Order (Ctrl+R)", font=inter(12),
+            label="Reset Order (Ctrl+R)", font=FONT_12,
             command=master.reset_order)
         self.file_menu.add_command(
-            label="Shuffle (Ctrl+S)", font=inter(12), command=master.shuffle)
+            label="Shuffle (Ctrl+S)", font=FONT_12, command=master.shuffle)
         self.file_menu.add_command(
-            label="Start", font=inter(12), command=master.start)
+            label="Start", font=FONT_12, command=master.start)
         self.file_menu.add_separator()
         self.file_menu.add_command(
-            label="Back", font=inter(12), command=master.back)
+            label="Back", font=FONT_12, command=master.back)
         self.file_menu.add_command(
-            label="Close App (Alt+F4)", font=inter(12), command=main.quit_app)
+            label="Close App (Alt+F4)", font=FONT_12, command=main.quit_app)
         self.add_cascade(label="File", menu=self.file_menu)
     
     def update_state(self) -> None:
@@ -1170,8 +1419,7 @@ class PlaylistPlaySettingsFrame(tk.Frame):
         disabled if already in original order.
         """
         self.reset_order_button.config(
-            state=bool_to_state(
-                self.master.data.files != self.master.original_order))
+            state=bool_to_state(self.master.order_changed))
 
 
 class PlaylistPlayButtons(tk.Frame):
@@ -1180,8 +1428,8 @@ class PlaylistPlayButtons(tk.Frame):
     def __init__(self, master: PlaylistPlayFrame) -> None:
         super().__init__(master)
         self.back_button = Button(
-            self, "Back", inter(20), command=master.back)
+            self, "Back", FONT_20, command=master.back)
         self.start_button = Button(
-            self, "Start", inter(20), command=master.start)
+            self, "Start", FONT_20, command=master.start)
         self.back_button.pack(padx=5, pady=3, side="left")
         self.start_button.pack(padx=5, pady=3, side="right")
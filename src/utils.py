@@ -1,4 +1,5 @@
 """Utilities for the program."""
+import functools
 import pathlib
 import sys
 from tkinter import filedialog
@@ -39,10 +40,16 @@ ALLOWED_EXTENSIONS_DICT = {
     ".mp4": "MP4 (Audio only)"
 }
 ALLOWED_EXTENSIONS = tuple(ALLOWED_EXTENSIONS_DICT)
+# File dialog file types when opening an audio file.
+AUDIO_FILE_TYPES = (
+    *(("Audio", extension) for extension in ALLOWED_EXTENSIONS),
+    *((name, extension) for extension, name in ALLOWED_EXTENSIONS_DICT.items())
+)
 
 
+@functools.lru_cache(maxsize=64)
 def inter(size: int, bold: bool = False, italic: bool = False) -> tuple:
-    """Creates a Inter font option."""
+    """Creates a Inter font option, reused for identical options."""
     font = ("Inter", size)
     if bold:
         font += ("bold",)
@@ -70,18 +77,20 @@ def format_seconds(seconds: float) -> str:
     Converts seconds to either HH:MM:SS or MM:SS,
     whichever one is appropriate.
     """
-    seconds = int(seconds)
-    hours = str(seconds // 3600).zfill(2)
-    minutes = str(seconds // 60 % 60).zfill(2)
-    seconds = str(seconds % 60).zfill(2)
+    hours, seconds = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(seconds, 60)
     # Only display hours if hours > 0.
-    if hours != "00":
-        return f"{hours}:{minutes}:{seconds}"
-    return f"{minutes}:{seconds}"
+    if hours:
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+    return f"{minutes:02}:{seconds:02}"
 
 
+@functools.lru_cache(maxsize=None)
 def load_image(image_name: str) -> ImageTk.PhotoImage:
-    """Loads an image from a given file name, ready to be displayed."""
+    """
+    Loads an image from a given file name, ready to be displayed.
+    Each image is only loaded once and then shared, so must not be modified.
+    """
     image_file_path = IMAGES_FOLDER / image_name
     return ImageTk.PhotoImage(file=image_file_path)
 
@@ -101,12 +110,7 @@ def open_audio_file(file_path: str | None = None) -> str | None:
     starting the script from the terminal with an initial file path.
     """
     if file_path is None:
-        file_path = filedialog.askopenfilename(
-            filetypes=(
-                *(("Audio", extension) for extension in ALLOWED_EXTENSIONS),
-                *(
-                    (name, extension)
-                    for extension, name in ALLOWED_EXTENSIONS_DICT.items())))
+        file_path = filedialog.askopenfilename(filetypes=AUDIO_FILE_TYPES)
     if not file_path:
         # Cancelled.
         return None
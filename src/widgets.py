@@ -276,9 +276,9 @@ class Listbox(tk.Frame):
         """Removes the element at the given index."""
         self.listbox.delete(index)
     
-    def clear(self) -> None:
-        """Empties the listbox."""
-        self.listbox.delete(0, "end")
+    def clear(self, start: int = 0) -> None:
+        """Empties the listbox, from the start index onwards."""
+        self.listbox.delete(start, "end")
      
     def swap(
         self, index1: int, index2: int, keep_select: bool = True